@@ -1,7 +1,8 @@
 """Backtesting broker for historical simulation."""
 
 import asyncio
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import ib_insync as ib
@@ -49,6 +50,8 @@ class BacktestBroker(BrokerClient):
         # Avoid IB.__del__ calling disconnect on a closed event loop at interpreter shutdown
         self.ib_client.__del__ = lambda: None
         self._historical_cache: Dict[str, List] = {}
+        # Parsed bar dates, parallel to _historical_cache
+        self._bar_dates: Dict[str, List[date]] = {}
 
     async def connect(self) -> None:
         """Connect to IBKR for historical data."""
@@ -64,6 +67,26 @@ class BacktestBroker(BrokerClient):
         """Advance simulation date by N days."""
         self.current_date += timedelta(days=days)
 
+    @staticmethod
+    def _bar_date(bar) -> date:
+        """Normalize bar.date (string, date or datetime) to a date."""
+        if isinstance(bar.date, str):
+            return datetime.strptime(bar.date, "%Y%m%d").date()
+        return bar.date.date() if isinstance(bar.date, datetime) else bar.date
+
+    def _store_bars(self, symbol: str, bars: List) -> None:
+        """Cache bars and their parsed dates once so daily lookups can bisect."""
+        self._historical_cache[symbol] = bars
+        self._bar_dates[symbol] = [self._bar_date(bar) for bar in bars]
+
+    def _bar_window(self, symbol: str, days: int) -> List:
+        """Bars dated within [current_date - days, current_date]."""
+        dates = self._bar_dates.get(symbol, [])
+        cutoff = (self.current_date - timedelta(days=days)).date()
+        lo = bisect_left(dates, cutoff)
+        hi = bisect_right(dates, self.current_date.date())
+        return self._historical_cache.get(symbol, [])[lo:hi]
+
     async def _fetch_bars_for_symbol(self, symbol: str) -> tuple[str, List]:
         """Fetch bars for a single symbol (helper for parallelization)."""
         await self.connect()
@@ -110,34 +133,14 @@ class BacktestBroker(BrokerClient):
         # Get historical data if not cached
         if symbol not in self._historical_cache:
             symbol, bars = await self._fetch_bars_for_symbol(symbol)
-            self._historical_cache[symbol] = bars
+            self._store_bars(symbol, bars)
         
-        # Find price for current_date
+        # Price for current_date, or the closest previous bar if the exact date is missing
         bars = self._historical_cache.get(symbol, [])
-        for bar in bars:
-            # bar.date can be either a string or date object
-            if isinstance(bar.date, str):
-                bar_date_obj = datetime.strptime(bar.date, "%Y%m%d").date()
-            else:
-                bar_date_obj = bar.date if isinstance(bar.date, type(self.current_date.date())) else bar.date.date()
-            
-            if bar_date_obj == self.current_date.date():
-                return Quote(symbol=symbol, price=bar.close, volume=bar.volume)
-        
-        # If exact date not found, use closest previous date
-        closest_bar = None
-        for bar in bars:
-            # bar.date can be either a string or date object
-            if isinstance(bar.date, str):
-                bar_date_obj = datetime.strptime(bar.date, "%Y%m%d").date()
-            else:
-                bar_date_obj = bar.date if isinstance(bar.date, type(self.current_date.date())) else bar.date.date()
-            
-            if bar_date_obj <= self.current_date.date():
-                closest_bar = bar
-        
-        if closest_bar:
-            return Quote(symbol=symbol, price=closest_bar.close, volume=closest_bar.volume)
+        idx = bisect_right(self._bar_dates.get(symbol, []), self.current_date.date()) - 1
+        if idx >= 0:
+            bar = bars[idx]
+            return Quote(symbol=symbol, price=bar.close, volume=bar.volume)
         
         return Quote(symbol=symbol, price=0.0, volume=0.0)
 
@@ -148,21 +151,8 @@ class BacktestBroker(BrokerClient):
         if symbol not in self._historical_cache:
             await self.fetch_quote(symbol)  # Populate cache
         
-        bars = self._historical_cache.get(symbol, [])
-        
         # Get prices for the last N days before current_date
-        prices = []
-        cutoff_date = self.current_date - timedelta(days=days)
-        
-        for bar in bars:
-            # bar.date can be either a string or date object
-            if isinstance(bar.date, str):
-                bar_date_obj = datetime.strptime(bar.date, "%Y%m%d").date()
-            else:
-                bar_date_obj = bar.date if isinstance(bar.date, type(self.current_date.date())) else bar.date.date()
-            
-            if cutoff_date.date() <= bar_date_obj <= self.current_date.date():
-                prices.append(bar.close)
+        prices = [bar.close for bar in self._bar_window(symbol, days)]
         
         return prices[-days:] if prices else []
 
@@ -173,21 +163,8 @@ class BacktestBroker(BrokerClient):
         if symbol not in self._historical_cache:
             await self.fetch_quote(symbol)  # Populate cache
         
-        bars = self._historical_cache.get(symbol, [])
-        
         # Get volumes for the last N days before current_date
-        volumes = []
-        cutoff_date = self.current_date - timedelta(days=days)
-        
-        for bar in bars:
-            # bar.date can be either a string or date object
-            if isinstance(bar.date, str):
-                bar_date_obj = datetime.strptime(bar.date, "%Y%m%d").date()
-            else:
-                bar_date_obj = bar.date if isinstance(bar.date, type(self.current_date.date())) else bar.date.date()
-            
-            if cutoff_date.date() <= bar_date_obj <= self.current_date.date():
-                volumes.append(float(bar.volume))
+        volumes = [float(bar.volume) for bar in self._bar_window(symbol, days)]
         
         return volumes[-days:] if volumes else []
 
@@ -305,11 +282,20 @@ class BacktestBroker(BrokerClient):
         
         return total
 
-    async def preload_all_tickers(self, symbols: List[str]) -> None:
-        """Preload historical data for all tickers in parallel."""
+    async def preload_all_tickers(self, symbols: List[str], max_concurrency: int = 8) -> None:
+        """Preload historical data for all tickers, max_concurrency requests at a time."""
         self.logger.info(f"Preloading {len(symbols)} tickers...")
-        tasks = [self._fetch_bars_for_symbol(sym) for sym in symbols]
-        results: List[Tuple[str, List] | BaseException] = await asyncio.gather(*tasks, return_exceptions=True)
+        # IBKR paces historical data requests; firing the whole universe at once triggers throttling
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded_fetch(sym: str) -> tuple[str, List]:
+            async with sem:
+                return await self._fetch_bars_for_symbol(sym)
+
+        tasks = [_bounded_fetch(sym) for sym in symbols]
+        results: List[Tuple[str, List] | BaseException] = await asyncio.gather(
+            *tasks, return_exceptions=True
+        )
 
         missing: List[str] = []
 
@@ -323,7 +309,7 @@ class BacktestBroker(BrokerClient):
             symbol, bars = item
             if not bars:
                 missing.append(symbol)
-            self._historical_cache[symbol] = bars
+            self._store_bars(symbol, bars)
 
         self.missing_symbols = missing
         if missing:
@@ -340,14 +326,5 @@ class BacktestBroker(BrokerClient):
 
     def has_data_on_or_before(self, symbol: str, date: datetime) -> bool:
         """Return True if we have at least one historical bar on or before the given date."""
-        bars = self._historical_cache.get(symbol, [])
-        if not bars:
-            return False
-        for bar in bars:
-            if isinstance(bar.date, str):
-                bar_date_obj = datetime.strptime(bar.date, "%Y%m%d").date()
-            else:
-                bar_date_obj = bar.date if isinstance(bar.date, type(self.current_date.date())) else bar.date.date()
-            if bar_date_obj <= date.date():
-                return True
-        return False
+        dates = self._bar_dates.get(symbol, [])
+        return bool(dates) and dates[0] <= date.date()
@@ -1,23 +1,24 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     symbol: str
     price: float
     volume: Optional[float] = None  # For volume anomaly detection
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str
     qty: float
     avg_price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     symbol: str
     qty: float
@@ -38,6 +39,16 @@ class BrokerClient(ABC):
     async def fetch_quote(self, symbol: str) -> Quote:
         raise NotImplementedError
 
+    async def fetch_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
+        """
+        Fetch quotes for several symbols, keyed by symbol.
+
+        Default fetches them one by one concurrently; override when the broker can
+        quote a batch in one round trip.
+        """
+        quotes = await asyncio.gather(*(self.fetch_quote(symbol) for symbol in symbols))
+        return dict(zip(symbols, quotes))
+
     @abstractmethod
     async def fetch_historical(self, symbol: str, days: int = 60) -> List[float]:
         """Fetch historical daily closing prices for trend analysis."""
@@ -52,6 +63,21 @@ class BrokerClient(ABC):
         """Place order. If limit_price is set, uses limit order instead of market order."""
         raise NotImplementedError
 
+    async def place_orders(
+        self, orders: List[Tuple[str, float, str]]
+    ) -> List[Union[OrderResult, Exception]]:
+        """
+        Place several market orders given as (symbol, qty, side), results in the same order.
+
+        An order that fails yields its exception in place, so fills of the others
+        are still reported. Default places them one by one concurrently; override
+        when the broker can submit a batch in one round trip.
+        """
+        return list(await asyncio.gather(
+            *(self.place_order(symbol, qty, side) for symbol, qty, side in orders),
+            return_exceptions=True,
+        ))
+
     async def place_limit_order(self, symbol: str, qty: float, side: str, limit_price: float) -> OrderResult:
         """Convenience method for limit orders."""
         return await self.place_order(symbol, qty, side, limit_price=limit_price)
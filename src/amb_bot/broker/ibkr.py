@@ -1,5 +1,5 @@
 import asyncio
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import ib_insync as ib
 
@@ -36,10 +36,37 @@ class IBKRClient(BrokerClient):
         await self.connect()
         contract = ib.Stock(symbol, "SMART", "USD")
         await self.ib_client.qualifyContractsAsync(contract)
+        if not contract.conId:
+            raise LookupError(f"IBKR does not know symbol {symbol}")
         ticker = self.ib_client.reqMktData(contract, "", False, False)
         await asyncio.sleep(2)  # Wait for market data
         self.ib_client.cancelMktData(contract)
         
+        return self._quote_from_ticker(symbol, ticker)
+
+    async def fetch_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
+        """
+        Fetch quotes as one batch: qualify all contracts at once, wait for market data once.
+
+        Symbols IBKR can't qualify are left out of the result.
+        """
+        await self.connect()
+        contracts = [ib.Stock(symbol, "SMART", "USD") for symbol in symbols]
+        await self.ib_client.qualifyContractsAsync(*contracts)
+        contracts = [contract for contract in contracts if contract.conId]
+        symbols = [contract.symbol for contract in contracts]
+        tickers = [self.ib_client.reqMktData(contract, "", False, False) for contract in contracts]
+        await asyncio.sleep(2)  # Wait for market data
+        for contract in contracts:
+            self.ib_client.cancelMktData(contract)
+        
+        return {
+            symbol: self._quote_from_ticker(symbol, ticker)
+            for symbol, ticker in zip(symbols, tickers)
+        }
+
+    @staticmethod
+    def _quote_from_ticker(symbol: str, ticker: ib.Ticker) -> Quote:
         price = ticker.marketPrice()
         if price != price:  # NaN check
             price = ticker.close if ticker.close == ticker.close else 0.0
@@ -100,6 +127,33 @@ class IBKRClient(BrokerClient):
         trade = self.ib_client.placeOrder(contract, order)
         await asyncio.sleep(2)  # Wait for fill
         
+        return self._order_result(symbol, side, trade)
+
+    async def place_orders(
+        self, orders: List[Tuple[str, float, str]]
+    ) -> List[Union[OrderResult, Exception]]:
+        """Place market orders as one batch: qualify all contracts at once, wait for fills once."""
+        await self.connect()
+        contracts = [ib.Stock(symbol, "SMART", "USD") for symbol, _, _ in orders]
+        await self.ib_client.qualifyContractsAsync(*contracts)
+        
+        # One rejected order must not hide the fills of orders already submitted
+        trades: List[Union[ib.Trade, Exception]] = []
+        for contract, (_, qty, side) in zip(contracts, orders):
+            action = "BUY" if side.lower() == "buy" else "SELL"
+            try:
+                trades.append(self.ib_client.placeOrder(contract, ib.MarketOrder(action, qty)))
+            except Exception as e:
+                trades.append(e)
+        await asyncio.sleep(2)  # Wait for fills
+        
+        return [
+            trade if isinstance(trade, Exception) else self._order_result(symbol, side, trade)
+            for (symbol, _, side), trade in zip(orders, trades)
+        ]
+
+    @staticmethod
+    def _order_result(symbol: str, side: str, trade: ib.Trade) -> OrderResult:
         fill_price = trade.orderStatus.avgFillPrice if trade.fills else 0.0
         filled_qty = sum(fill.execution.shares for fill in trade.fills) if trade.fills else 0.0
         
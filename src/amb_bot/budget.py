@@ -6,6 +6,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+try:  # Optional faster JSON parser
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,11 +47,10 @@ class BudgetTracker:
             return
         
         try:
-            with self.data_file.open("r") as f:
-                data = json.load(f)
-                self.current_month = data.get("current_month", "")
-                self.monthly_spent = data.get("monthly_spent", 0.0)
-                self.trades = [Trade(**t) for t in data.get("trades", [])]
+            data = _json_loads(self.data_file.read_bytes())
+            self.current_month = data.get("current_month", "")
+            self.monthly_spent = data.get("monthly_spent", 0.0)
+            self.trades = [Trade(**t) for t in data.get("trades", [])]
             
             # Check if new month
             now_month = datetime.now().strftime("%Y-%m")
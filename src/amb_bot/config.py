@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -96,6 +97,8 @@ class Settings(BaseSettings):
     ibkr_host: str = Field("127.0.0.1", description="IBKR TWS/Gateway host")
     ibkr_port: int = Field(7497, description="IBKR port (7497=TWS paper, 4002=Gateway paper)")
     ibkr_client_id: int = Field(1, description="IBKR client ID")
+    max_concurrent_quotes: int = Field(8, ge=1, description="Max quote requests in flight at once")
+    max_order_concurrency: int = Field(4, ge=1, description="Max orders in flight at once")
     log_level: str = Field("INFO", description="Logging level")
 
     # Short-term simulation overrides
@@ -237,5 +240,7 @@ class Settings(BaseSettings):
         return data
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Load settings once per process; call ``get_settings.cache_clear()`` to reload."""
     return Settings.load()
@@ -9,6 +9,7 @@ Simple commands:
 import asyncio
 import logging
 from datetime import datetime
+from typing import Callable, Sequence, Tuple
 
 import typer
 from rich.console import Console
@@ -22,6 +23,45 @@ from .budget import BudgetTracker, Trade
 app = typer.Typer(help="AMB DCA Bot - Monthly DCA with 10% SL / 15% TP")
 console = Console()
 
+_CYCLE_RULE = f"[yellow]{'=' * 60}[/yellow]"
+_FINAL_RULE = f"[cyan]{'=' * 60}[/cyan]"
+
+# (label, formatter) rows for budget summary tables
+_SummaryRows = Sequence[Tuple[str, Callable[[dict], str]]]
+
+_CYCLE_ROWS: _SummaryRows = (
+    ("Budget", lambda s: f"{s['budget']:.2f}€"),
+    ("Spent", lambda s: f"{s['spent']:.2f}€"),
+    ("Remaining", lambda s: f"{s['remaining']:.2f}€"),
+    ("Trades", lambda s: str(s['trades_count'])),
+    ("Buys", lambda s: str(s['buys'])),
+    ("Sells", lambda s: str(s['sells'])),
+)
+_STATUS_ROWS: _SummaryRows = (
+    ("Monthly Budget", lambda s: f"{s['budget']:.2f}€"),
+    ("Spent", lambda s: f"{s['spent']:.2f}€"),
+    ("Remaining", lambda s: f"{s['remaining']:.2f}€"),
+    ("Usage", lambda s: f"{(s['spent']/s['budget']*100):.1f}%"),
+    ("", lambda s: ""),
+    ("Total Trades", lambda s: str(s['trades_count'])),
+    ("Buys", lambda s: str(s['buys'])),
+    ("Sells", lambda s: str(s['sells'])),
+    ("Total Bought", lambda s: f"{s['total_bought']:.2f}€"),
+    ("Total Sold", lambda s: f"{s['total_sold']:.2f}€"),
+)
+
+
+def build_summary_table(
+    summary: dict, title: str, rows: _SummaryRows = _CYCLE_ROWS, no_wrap: bool = False
+) -> Table:
+    """Build a Metric/Value table from a BudgetTracker month summary."""
+    table = Table(title=title)
+    table.add_column("Metric", style="cyan", no_wrap=no_wrap)
+    table.add_column("Value", style="magenta")
+    for label, fmt in rows:
+        table.add_row(label, fmt(summary))
+    return table
+
 
 def get_broker(settings) -> BrokerClient:
     """Factory to create IBKR broker client."""
@@ -89,18 +129,21 @@ async def run_simulate(cycles: int) -> None:
     budget_tracker = BudgetTracker(settings.monthly_budget)
     total_trades = 0
 
-    for cycle in range(1, cycles + 1):
-        console.print(f"\n[yellow]{'='*60}[/yellow]")
-        console.print(f"[yellow]📆 Cycle {cycle}/{cycles} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/yellow]")
-        console.print(f"[yellow]{'='*60}[/yellow]")
+    # Single broker session for all cycles: connect/disconnect only at the bookends
+    broker = get_broker(settings)
+    if hasattr(broker, 'connect'):
+        await broker.connect()
 
-        broker = get_broker(settings)
-        
-        # Connect if IBKR
-        if hasattr(broker, 'connect'):
-            await broker.connect()
+    try:
+        for cycle in range(1, cycles + 1):
+            # One clock read per cycle: header and trade timestamps share it
+            now = datetime.now()
+            timestamp = now.isoformat()
+            console.print("\n" + _CYCLE_RULE)
+            stamp = now.strftime('%Y-%m-%d %H:%M:%S')
+            console.print(f"[yellow]📆 Cycle {cycle}/{cycles} - {stamp}[/yellow]")
+            console.print(_CYCLE_RULE)
 
-        try:
             # Execute strategy
             results = await strategy.execute(broker)
             total_trades += len(results)
@@ -108,7 +151,7 @@ async def run_simulate(cycles: int) -> None:
             # Track trades in budget
             for res in results:
                 trade = Trade(
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=timestamp,
                     symbol=res.symbol,
                     side=res.side,
                     qty=res.qty,
@@ -120,32 +163,21 @@ async def run_simulate(cycles: int) -> None:
 
             # Show cycle summary
             summary = budget_tracker.get_month_summary()
-            table = Table(title=f"Cycle {cycle} Summary")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="magenta")
+            console.print(build_summary_table(summary, f"Cycle {cycle} Summary"))
 
-            table.add_row("Budget", f"{summary['budget']:.2f}€")
-            table.add_row("Spent", f"{summary['spent']:.2f}€")
-            table.add_row("Remaining", f"{summary['remaining']:.2f}€")
-            table.add_row("Trades", str(summary['trades_count']))
-            table.add_row("Buys", str(summary['buys']))
-            table.add_row("Sells", str(summary['sells']))
+            # Reset budget for next cycle
+            budget_tracker.reset_month()
 
-            console.print(table)
-
-        finally:
-            # Disconnect if IBKR
-            if hasattr(broker, 'disconnect'):
-                await broker.disconnect()
-
-        # Reset budget for next cycle
-        budget_tracker.reset_month()
+    finally:
+        # Disconnect if IBKR
+        if hasattr(broker, 'disconnect'):
+            await broker.disconnect()
 
     # Final summary
-    console.print(f"\n[cyan]{'='*60}[/cyan]")
+    console.print("\n" + _FINAL_RULE)
     console.print(f"[green]✅ Simulation complete![/green]")
     console.print(f"[cyan]   Total trades: {total_trades}[/cyan]")
-    console.print(f"[cyan]{'='*60}[/cyan]\n")
+    console.print(_FINAL_RULE + "\n")
 
 
 @app.command()
@@ -167,22 +199,8 @@ def status() -> None:
     budget_tracker = BudgetTracker(settings.monthly_budget)
     summary = budget_tracker.get_month_summary()
 
-    table = Table(title=f"📊 Budget Status - {summary['month']}")
-    table.add_column("Metric", style="cyan", no_wrap=True)
-    table.add_column("Value", style="magenta")
-
-    table.add_row("Monthly Budget", f"{summary['budget']:.2f}€")
-    table.add_row("Spent", f"{summary['spent']:.2f}€")
-    table.add_row("Remaining", f"{summary['remaining']:.2f}€")
-    table.add_row("Usage", f"{(summary['spent']/summary['budget']*100):.1f}%")
-    table.add_row("", "")
-    table.add_row("Total Trades", str(summary['trades_count']))
-    table.add_row("Buys", str(summary['buys']))
-    table.add_row("Sells", str(summary['sells']))
-    table.add_row("Total Bought", f"{summary['total_bought']:.2f}€")
-    table.add_row("Total Sold", f"{summary['total_sold']:.2f}€")
-
-    console.print(table)
+    title = f"📊 Budget Status - {summary['month']}"
+    console.print(build_summary_table(summary, title, _STATUS_ROWS, no_wrap=True))
 
 
 @app.command()
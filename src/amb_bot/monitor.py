@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from rich.console import Console
 from rich.layout import Layout
@@ -25,6 +25,8 @@ class LiveMonitor:
         self.settings = settings
         self.console = Console()
         self.running = False
+        self._layout: Optional[Layout] = None
+        self._data_key: Optional[tuple] = None
     
     def _make_header(self) -> Panel:
         """Create header panel with status."""
@@ -135,19 +137,19 @@ class LiveMonitor:
         layout = Layout()
         
         layout.split_column(
-            Layout(self._make_header(), size=5),
+            Layout(self._make_header(), name="header", size=5),
             Layout(name="body"),
             Layout(name="footer", size=10)
         )
         
         layout["body"].split_row(
-            Layout(self._make_positions_table(positions, quotes)),
+            Layout(self._make_positions_table(positions, quotes), name="positions"),
             Layout(name="right", ratio=1)
         )
         
         layout["right"].split_column(
-            Layout(self._make_summary(positions, quotes)),
-            Layout(self._make_config_panel())
+            Layout(self._make_summary(positions, quotes), name="summary"),
+            Layout(self._make_config_panel(), name="config")
         )
         
         # Footer
@@ -155,10 +157,27 @@ class LiveMonitor:
         footer_text.append("Press ", style="dim")
         footer_text.append("Ctrl+C", style="bold yellow")
         footer_text.append(" to stop monitoring", style="dim")
-        layout["footer"] = Panel(footer_text, style="dim")
+        layout["footer"].update(Panel(footer_text, style="dim"))
         
         return layout
     
+    def _update_layout(self, positions: List[Position], quotes: dict) -> Layout:
+        """Reuse the last layout, rebuilding only regions whose inputs changed."""
+        data_key = tuple(
+            (pos.symbol, pos.qty, pos.avg_price, getattr(quotes.get(pos.symbol), "price", None))
+            for pos in positions
+        )
+        if self._layout is None:
+            self._layout = self._make_layout(positions, quotes)
+        else:
+            # The clock moves every frame; config and footer never change
+            self._layout["header"].update(self._make_header())
+            if data_key != self._data_key:
+                self._layout["positions"].update(self._make_positions_table(positions, quotes))
+                self._layout["summary"].update(self._make_summary(positions, quotes))
+        self._data_key = data_key
+        return self._layout
+    
     async def _fetch_quotes(self, positions: List[Position]) -> dict:
         """Fetch current quotes for all positions."""
         quotes = {}
@@ -179,7 +198,9 @@ class LiveMonitor:
             await self.broker.connect()
         
         try:
-            with Live(console=self.console, refresh_per_second=0.5, screen=True) as live:
+            # Redraw only when fresh data arrives; auto-refresh would re-render the same
+            # layout several times per fetch interval
+            with Live(console=self.console, auto_refresh=False, screen=True) as live:
                 while self.running:
                     try:
                         # Fetch current positions
@@ -189,8 +210,8 @@ class LiveMonitor:
                         quotes = await self._fetch_quotes(positions)
                         
                         # Update display
-                        layout = self._make_layout(positions, quotes)
-                        live.update(layout)
+                        layout = self._update_layout(positions, quotes)
+                        live.update(layout, refresh=True)
                         
                         # Wait before next refresh
                         await asyncio.sleep(refresh_interval)
@@ -1,20 +1,42 @@
 """Simplified DCA Strategy with 10% Stop-Loss and 15% Take-Profit."""
+import asyncio
 import logging
-from typing import Dict, List
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 
-from .broker.base import BrokerClient, OrderResult, Position
+from .broker.base import BrokerClient, OrderResult, Position, Quote
 from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+_BANNER_NL = "\n" + _BANNER
 
+# Below this budget the DCA phase is skipped entirely
+_MIN_DCA_BUDGET = 50.0
+
+# Smallest DCA order worth placing, in base currency
+_MIN_ORDER_NOTIONAL = 10.0
+
+# How long a symbol the broker can't quote stays out of the DCA universe
+_SKIP_TTL_S = 3600.0
+
+
+def _track(fut: "asyncio.Future[Quote]") -> "asyncio.Future[Quote]":
+    """Mark a quote future's exception as retrieved; callers read it via gather()."""
+    fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return fut
+
+
+@dataclass(slots=True)
 class Decision:
     """Trade decision representation."""
-    def __init__(self, action: str, symbol: str, qty: float, reason: str = ""):
-        self.action = action
-        self.symbol = symbol
-        self.qty = qty
-        self.reason = reason
+    action: str
+    symbol: str
+    qty: float
+    reason: str = ""
+    price: Optional[float] = None  # Quote price the decision was sized on
 
 
 class Strategy:
@@ -23,57 +45,229 @@ class Strategy:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.highest_prices: Dict[str, float] = {}  # Track peak price for trailing stop
+        # Concurrency limits for the event loop they were created in (see _semaphore)
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        # Quote requests keyed by symbol, shared by both phases of one execute() run;
+        # None outside execute(), so direct planner calls always see fresh quotes
+        self._quote_cache: Optional[Dict[str, "asyncio.Future[Quote]"]] = None
+        self._skip_symbols: Dict[str, float] = {}  # symbol -> time.monotonic() expiry
+
+    def _semaphore(self, name: str, limit: int) -> asyncio.Semaphore:
+        """
+        Return the named semaphore for the running event loop, creating it on first use.
 
-    async def plan_exits(self, broker: BrokerClient) -> List[Decision]:
+        asyncio primitives bind to the loop they first wait in, so a Strategy reused
+        under another asyncio.run() gets fresh ones.
+        """
+        loop = asyncio.get_running_loop()
+        if self._sem_loop is not loop:
+            self._sem_loop = loop
+            self._sems = {}
+        sem = self._sems.get(name)
+        if sem is None:
+            sem = self._sems[name] = asyncio.Semaphore(limit)
+        return sem
+
+    def _quote_future(
+        self, broker: BrokerClient, symbol: str, cache: Dict[str, "asyncio.Future[Quote]"]
+    ) -> "asyncio.Future[Quote]":
+        """Return the in-flight or completed quote request for symbol, starting one on first use."""
+        fut = cache.get(symbol)
+        if fut is None:
+            fut = cache[symbol] = _track(asyncio.ensure_future(self._request_quote(broker, symbol)))
+        return fut
+
+    async def _request_quote(self, broker: BrokerClient, symbol: str) -> Quote:
+        async with self._semaphore("quote", self.settings.max_concurrent_quotes):
+            return await broker.fetch_quote(symbol)
+
+    @staticmethod
+    async def _quote_from_batch(batch: "asyncio.Future[Dict[str, Quote]]", symbol: str) -> Quote:
+        quotes = await asyncio.shield(batch)
+        if symbol not in quotes:
+            raise LookupError(f"no quote returned for {symbol}")
+        return quotes[symbol]
+
+    def _prefetch_quotes(
+        self, broker: BrokerClient, symbols: List[str], cache: Dict[str, "asyncio.Future[Quote]"]
+    ) -> None:
+        """
+        Start quote requests for every symbol not already in cache, without waiting.
+
+        Brokers with a native fetch_quotes batch get one request for all of them;
+        otherwise each symbol gets its own bounded request.
+        """
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in cache]
+        if not missing:
+            return
+        if type(broker).fetch_quotes is not BrokerClient.fetch_quotes:
+            batch = asyncio.ensure_future(broker.fetch_quotes(missing))
+            for symbol in missing:
+                cache[symbol] = _track(asyncio.ensure_future(self._quote_from_batch(batch, symbol)))
+        else:
+            for symbol in missing:
+                self._quote_future(broker, symbol, cache)
+
+    async def _fetch_quotes(
+        self, broker: BrokerClient, symbols: List[str]
+    ) -> List[Union[Quote, BaseException]]:
+        """Fetch quotes concurrently (bounded or batched); failures are returned, not raised."""
+        # Outside execute() the cache lives for this call only
+        cache = self._quote_cache if self._quote_cache is not None else {}
+        self._prefetch_quotes(broker, symbols, cache)
+        # Failed requests stay cached too: each symbol is requested at most once per
+        # execute() run and retried on the next one. shield: one cancelled caller must
+        # not cancel a request other callers share.
+        futures = [self._quote_future(broker, symbol, cache) for symbol in symbols]
+        return await asyncio.gather(
+            *(asyncio.shield(fut) for fut in futures), return_exceptions=True
+        )
+
+    @staticmethod
+    def _filled(result: OrderResult, side: str) -> Optional[OrderResult]:
+        """Log a fill and return it, or None if nothing was filled."""
+        if result.qty <= 0:
+            return None
+        verb = "Sold" if side == "sell" else "Bought"
+        logger.info("   ✓ %s %.4f %s @ $%.2f", verb, result.qty, result.symbol, result.price)
+        return result
+
+    async def _place(self, broker: BrokerClient, dec: Decision, side: str) -> Optional[OrderResult]:
+        """Place one order (bounded); returns None if it failed or nothing was filled."""
+        try:
+            async with self._semaphore("order", self.settings.max_order_concurrency):
+                result = await broker.place_order(dec.symbol, dec.qty, side=side)
+        except Exception as e:
+            logger.error("   ✗ Failed to %s %s: %s", side, dec.symbol, e)
+            return None
+        return self._filled(result, side)
+
+    async def _place_all(
+        self, broker: BrokerClient, decisions: List[Decision], side: str
+    ) -> List[OrderResult]:
+        """
+        Place all orders of one side, keeping decision order in the results.
+
+        Uses the broker's native place_orders batch when it has one, otherwise
+        places individual orders concurrently.
+        """
+        if not decisions:
+            return []
+        if type(broker).place_orders is not BrokerClient.place_orders:
+            orders = [(dec.symbol, dec.qty, side) for dec in decisions]
+            try:
+                batch = await broker.place_orders(orders)
+            except Exception as e:
+                # Raised before any order went out (connection, contract qualification)
+                logger.error("   ✗ Failed to %s batch of %d orders: %s", side, len(decisions), e)
+                return []
+            placed = []
+            for dec, result in zip(decisions, batch):
+                if isinstance(result, Exception):
+                    logger.error("   ✗ Failed to %s %s: %s", side, dec.symbol, result)
+                    continue
+                placed.append(self._filled(result, side))
+        else:
+            placed = await asyncio.gather(*(self._place(broker, dec, side) for dec in decisions))
+        return [result for result in placed if result is not None]
+
+    async def plan_exits(
+        self, broker: BrokerClient, positions: Optional[List[Position]] = None
+    ) -> List[Decision]:
         """
         Exit positions based on:
         - Stop-loss at 10% loss
         - Take-profit at 15% gain
+
+        Pass already-fetched positions to avoid another list_positions() call.
         """
         decisions: List[Decision] = []
-        positions = await broker.list_positions()
+        if positions is None:
+            positions = await broker.list_positions()
+        quotes = await self._fetch_quotes(broker, [pos.symbol for pos in positions])
+
+        # Loop invariants
+        stop_loss = -self.settings.stop_loss_pct
+        take_profit = self.settings.take_profit_pct
+        highest = self.highest_prices
 
-        for pos in positions:
-            quote = await broker.fetch_quote(pos.symbol)
+        for pos, quote in zip(positions, quotes):
+            sym = pos.symbol
+            if isinstance(quote, BaseException):
+                logger.error("Error fetching quote for %s: %s", sym, quote)
+                continue
             price = quote.price
             if price <= 0:
                 continue
-
-            # Calculate P&L percentage
             pnl_pct = (price - pos.avg_price) / pos.avg_price if pos.avg_price > 0 else 0
-            
-            # Update highest price for reference
-            if pos.symbol not in self.highest_prices:
-                self.highest_prices[pos.symbol] = max(pos.avg_price, price)
-            elif price > self.highest_prices[pos.symbol]:
-                self.highest_prices[pos.symbol] = price
+
+            # Update highest price for reference (one lookup, at most one store)
+            peak = highest.get(sym)
+            if peak is None:
+                highest[sym] = max(pos.avg_price, price)
+            elif price > peak:
+                highest[sym] = price
 
             # Stop-loss: exit if down 10%
-            if pnl_pct <= -self.settings.stop_loss_pct:
-                logger.info(f"🛑 Stop-loss for {pos.symbol}: P&L={pnl_pct*100:.1f}%")
+            if pnl_pct <= stop_loss:
+                pnl_display = pnl_pct * 100
+                logger.info("🛑 Stop-loss for %s: P&L=%.1f%%", sym, pnl_display)
                 decisions.append(Decision(
                     action="sell",
-                    symbol=pos.symbol,
+                    symbol=sym,
                     qty=pos.qty,
-                    reason=f"stop_loss (P&L: {pnl_pct*100:.1f}%)"
+                    reason=f"stop_loss (P&L: {pnl_display:.1f}%)",
+                    price=price,
                 ))
-                self.highest_prices.pop(pos.symbol, None)
+                highest.pop(sym, None)
                 continue
 
             # Take-profit: exit if up 15%
-            if pnl_pct >= self.settings.take_profit_pct:
-                logger.info(f"✅ Take-profit for {pos.symbol}: P&L={pnl_pct*100:.1f}%")
+            if pnl_pct >= take_profit:
+                pnl_display = pnl_pct * 100
+                logger.info("✅ Take-profit for %s: P&L=%.1f%%", sym, pnl_display)
                 decisions.append(Decision(
                     action="sell",
-                    symbol=pos.symbol,
+                    symbol=sym,
                     qty=pos.qty,
-                    reason=f"take_profit (P&L: {pnl_pct*100:.1f}%)"
+                    reason=f"take_profit (P&L: {pnl_display:.1f}%)",
+                    price=price,
                 ))
-                self.highest_prices.pop(pos.symbol, None)
+                highest.pop(sym, None)
                 continue
 
         return decisions
 
+    def _entry_candidates(
+        self, budget_available: float
+    ) -> Tuple[List[str], Optional[Tuple[int, str, tuple]]]:
+        """
+        Universe symbols plan_entries will quote for this budget.
+
+        Returns (candidates, skip): when DCA is skipped, candidates is empty and skip is
+        the (level, message, args) log record saying why; otherwise skip is None.
+        """
+        if budget_available < _MIN_DCA_BUDGET:
+            return [], (logging.INFO, "⏭️  Insufficient budget: %.2f€", (budget_available,))
+
+        universe = self.settings.universe
+        if not universe:
+            return [], (logging.WARNING, "❌ Empty universe - no symbols to trade", ())
+
+        # Every order would fail the minimum-notional check; don't fetch any quotes
+        per_symbol_budget = budget_available / len(universe)
+        if per_symbol_budget < _MIN_ORDER_NOTIONAL:
+            return [], (
+                logging.INFO,
+                "⏭️  Per-symbol allocation %.2f€ below minimum order; skipping DCA",
+                (per_symbol_budget,),
+            )
+
+        # Don't re-request symbols that recently failed to quote
+        now = time.monotonic()
+        return [symbol for symbol in universe if self._skip_symbols.get(symbol, 0.0) <= now], None
+
     async def plan_entries(self, broker: BrokerClient, budget_available: float) -> List[Decision]:
         """
         Simple DCA: allocate monthly budget equally across universe.
@@ -82,44 +276,61 @@ class Strategy:
         """
         decisions: List[Decision] = []
 
-        if budget_available < 50:
-            logger.info(f"⏭️  Insufficient budget: {budget_available:.2f}€")
-            return decisions
-
-        universe = self.settings.universe
-        if not universe:
-            logger.warning("❌ Empty universe - no symbols to trade")
+        candidates, skip_reason = self._entry_candidates(budget_available)
+        if skip_reason is not None:
+            level, msg, args = skip_reason
+            logger.log(level, msg, *args)
             return decisions
 
         # Equal allocation: split budget across universe
+        universe = self.settings.universe
         per_symbol_budget = budget_available / len(universe)
-        logger.info(f"💰 DCA: {budget_available:.2f}€ → {len(universe)} symbols × {per_symbol_budget:.2f}€ each")
+        logger.info(
+            "💰 DCA: %.2f€ → %d symbols × %.2f€ each",
+            budget_available, len(universe), per_symbol_budget,
+        )
+        if len(candidates) < len(universe):
+            logger.debug(
+                "⏭️  Skipping %d recently failed symbols", len(universe) - len(candidates)
+            )
 
-        for symbol in universe:
+        now = time.monotonic()
+        skip = self._skip_symbols
+        quotes = await self._fetch_quotes(broker, candidates)
+        for symbol, quote in zip(candidates, quotes):
+            if isinstance(quote, BaseException):
+                logger.error("Error processing %s: %s", symbol, quote)
+                # Only the broker reporting the symbol unknown marks it bad; a failed batch
+                # or a dropped connection fails every symbol and is retried on the next run
+                if isinstance(quote, LookupError):
+                    skip[symbol] = now + _SKIP_TTL_S
+                continue
             try:
-                quote = await broker.fetch_quote(symbol)
-                if not quote.price or quote.price <= 0:
-                    logger.warning(f"⚠️  Skipping {symbol}: invalid price {quote.price}")
+                price = quote.price
+                if not price or price <= 0:
+                    # No tick yet is a market-data gap, not a bad symbol; retry next run
+                    logger.warning("⚠️  Skipping %s: invalid price %s", symbol, price)
                     continue
 
                 # Calculate quantity to buy
-                qty = per_symbol_budget / quote.price
-                qty = round(qty, 4)
+                qty = round(per_symbol_budget / price, 4)
+                notional = qty * price
 
-                if qty <= 0 or qty * quote.price < 10:
-                    logger.debug(f"⏭️  {symbol}: allocation too small ({qty * quote.price:.2f}€)")
+                if qty <= 0 or notional < _MIN_ORDER_NOTIONAL:
+                    logger.debug("⏭️  %s: allocation too small (%.2f€)", symbol, notional)
                     continue
 
                 decisions.append(Decision(
                     action="buy",
                     symbol=symbol,
                     qty=qty,
-                    reason=f"monthly_dca ({per_symbol_budget:.2f}€ / {quote.price:.2f}$)"
+                    reason=f"monthly_dca ({per_symbol_budget:.2f}€ / {price:.2f}$)",
+                    price=price,
                 ))
-                logger.info(f"📈 DCA buy {symbol}: {qty:.4f} @ ${quote.price:.2f}")
+                logger.info("📈 DCA buy %s: %.4f @ $%.2f", symbol, qty, price)
 
             except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
+                logger.error("Error processing %s: %s", symbol, e)
                 continue
 
         return decisions
@@ -130,49 +341,54 @@ class Strategy:
         1. Plan and execute exits (stop-loss / take-profit)
         2. Plan and execute entries (DCA)
         """
+        self._quote_cache = {}
+        try:
+            return await self._execute(broker)
+        finally:
+            self._quote_cache = None
+
+    async def _execute(self, broker: BrokerClient) -> List[OrderResult]:
         results: List[OrderResult] = []
-        logger.info("=" * 60)
+        logger.info(_BANNER)
         logger.info("🚀 Executing DCA strategy")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
+
+        # Use configured monthly budget for DCA allocation
+        budget_available = self.settings.monthly_budget
+
+        # Request every quote this run needs up front: held symbols and DCA candidates
+        # share one batch (or one set of bounded requests), each symbol fetched once
+        positions = await broker.list_positions()
+        self._prefetch_quotes(
+            broker,
+            [pos.symbol for pos in positions] + self._entry_candidates(budget_available)[0],
+            self._quote_cache,
+        )
 
         # Phase 1: Exits
-        logger.info("\n📉 Phase 1: Processing exits (stop-loss / take-profit)...")
-        exits = await self.plan_exits(broker)
-        for dec in exits:
-            try:
-                result = await broker.place_order(dec.symbol, dec.qty, side="sell")
-                if result.qty > 0:
-                    logger.info(f"   ✓ Sold {result.qty:.4f} {dec.symbol} @ ${result.price:.2f}")
-                    results.append(result)
-            except Exception as e:
-                logger.error(f"   ✗ Failed to sell {dec.symbol}: {e}")
+        if positions:
+            logger.info("\n📉 Phase 1: Processing exits (stop-loss / take-profit)...")
+            exits = await self.plan_exits(broker, positions)
+            results.extend(await self._place_all(broker, exits, "sell"))
 
-        if not exits:
-            logger.info("   ✓ No exits needed")
+            if not exits:
+                logger.info("   ✓ No exits needed")
+        else:
+            logger.info("\n📉 Phase 1: No open positions, skipping exits")
 
         # Phase 2: Entries (DCA)
         logger.info("\n📈 Phase 2: Processing entries (DCA)...")
-        
-        # Use configured monthly budget for DCA allocation
-        budget_available = self.settings.monthly_budget
-        logger.info(f"   Available budget: {budget_available:.2f}€")
+        logger.info("   Available budget: %.2f€", budget_available)
 
         entries = await self.plan_entries(broker, budget_available)
-        for dec in entries:
-            try:
-                result = await broker.place_order(dec.symbol, dec.qty, side="buy")
-                if result.qty > 0:
-                    logger.info(f"   ✓ Bought {result.qty:.4f} {dec.symbol} @ ${result.price:.2f}")
-                    results.append(result)
-            except Exception as e:
-                logger.error(f"   ✗ Failed to buy {dec.symbol}: {e}")
+        results.extend(await self._place_all(broker, entries, "buy"))
 
         if not entries:
             logger.info("   ✓ No entries needed")
 
         # Summary
-        logger.info("\n" + "=" * 60)
-        logger.info(f"✅ Execution complete: {len(results)} trades executed")
-        logger.info("=" * 60)
+        logger.info(_BANNER_NL)
+        logger.info("✅ Execution complete: %d trades executed", len(results))
+        logger.info(_BANNER)
 
         return results
@@ -2,7 +2,7 @@
 """Simple test script to verify IBKR connection."""
 
 import asyncio
-from ib_insync import IB, util
+from ib_insync import IB, Stock, util
 
 
 async def test_connection():
@@ -20,13 +20,21 @@ async def test_connection():
         await ib.connectAsync(host, port, clientId=client_id, timeout=20)
         print("✅ Connection successful!")
         
-        # Get account summary
+        # Account summary and contract qualification are independent round trips: run them together
+        contract = Stock("AAPL", "SMART", "USD")
+        account_values, _ = await asyncio.gather(
+            ib.accountSummaryAsync(),
+            ib.qualifyContractsAsync(contract),
+        )
+        # Start market data now so it streams while we print the rest
+        ticker = ib.reqMktData(contract)
+        market_data_deadline = asyncio.get_running_loop().time() + 2
+        
         print("\n📊 Account Summary:")
-        account_values = ib.accountSummary()
         for item in account_values[:10]:  # Show first 10 items
             print(f"  {item.tag}: {item.value} {item.currency}")
         
-        # Get positions
+        # Get positions (kept in sync by ib_insync since connect, no request needed)
         print("\n📈 Current Positions:")
         positions = ib.positions()
         if positions:
@@ -35,13 +43,18 @@ async def test_connection():
         else:
             print("  No positions")
         
-        # Test market data
+        # Test market data: the first ticks often carry only bid/ask, so keep waiting
+        # for a last price, up to 2s after the request
         print("\n💹 Testing Market Data (AAPL):")
-        from ib_insync import Stock
-        contract = Stock("AAPL", "SMART", "USD")
-        await ib.qualifyContractsAsync(contract)
-        ticker = ib.reqMktData(contract)
-        await asyncio.sleep(2)  # Wait for data
+        loop = asyncio.get_running_loop()
+        while util.isNan(ticker.last):
+            remaining = market_data_deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(ticker.updateEvent, timeout=remaining)
+            except asyncio.TimeoutError:
+                break
         
         print(f"  Last price: {ticker.last}")
         print(f"  Bid: {ticker.bid} | Ask: {ticker.ask}")
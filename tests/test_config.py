@@ -1,4 +1,7 @@
-from amb_bot.config import get_settings
+import pytest
+from pydantic import ValidationError
+
+from amb_bot.config import Settings, get_settings
 
 
 def test_settings_loads_defaults():
@@ -6,3 +9,9 @@ def test_settings_loads_defaults():
     assert settings.monthly_budget == 200
     assert settings.stop_loss_pct == 0.10
     assert settings.take_profit_pct == 0.15
+
+
+@pytest.mark.parametrize("field", ["max_concurrent_quotes", "max_order_concurrency"])
+def test_concurrency_limits_must_be_positive(field):
+    with pytest.raises(ValidationError):
+        Settings(**{field: 0})
@@ -0,0 +1,220 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from amb_bot.broker.base import BrokerClient, OrderResult, Position, Quote
+from amb_bot.config import Settings
+from amb_bot.strategy import Strategy
+
+
+class FakeBroker(BrokerClient):
+    def __init__(
+        self, prices: Dict[str, float], positions: Optional[List[Position]] = None
+    ) -> None:
+        self.prices = prices
+        self.positions = positions or []
+        self.quote_calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_quote(self, symbol: str) -> Quote:
+        self.quote_calls.append(symbol)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if symbol not in self.prices:
+            raise LookupError(f"no data for {symbol}")
+        return Quote(symbol=symbol, price=self.prices[symbol])
+
+    async def fetch_historical(self, symbol: str, days: int = 60) -> List[float]:
+        return []
+
+    async def place_order(
+        self, symbol: str, qty: float, side: str, limit_price: Optional[float] = None
+    ) -> OrderResult:
+        await asyncio.sleep(0)
+        return OrderResult(symbol=symbol, qty=qty, side=side, price=self.prices[symbol])
+
+    async def list_positions(self) -> List[Position]:
+        return list(self.positions)
+
+    async def close_position(self, symbol: str, qty: Optional[float] = None) -> OrderResult:
+        raise NotImplementedError
+
+
+def make_settings(**overrides) -> Settings:
+    params = dict(universe=["AAA", "BBB"], stop_loss_pct=0.10, take_profit_pct=0.15)
+    params.update(overrides)
+    return Settings(**params)
+
+
+def test_plan_exits_stop_loss_and_take_profit():
+    broker = FakeBroker(
+        {"AAA": 85.0, "BBB": 120.0, "CCC": 101.0},
+        [Position("AAA", 2, 100.0), Position("BBB", 1, 100.0), Position("CCC", 3, 100.0)],
+    )
+    decisions = asyncio.run(Strategy(make_settings()).plan_exits(broker))
+    assert [(d.symbol, d.qty, d.price) for d in decisions] == [("AAA", 2, 85.0), ("BBB", 1, 120.0)]
+    assert decisions[0].reason == "stop_loss (P&L: -15.0%)"
+    assert decisions[1].reason == "take_profit (P&L: 20.0%)"
+
+
+def test_plan_entries_bounds_concurrency_and_skips_failed_quotes():
+    universe = ["AAA", "BBB", "MISSING", "DDD"]
+    broker = FakeBroker({"AAA": 10.0, "BBB": 20.0, "DDD": 40.0})
+    strategy = Strategy(make_settings(universe=universe, max_concurrent_quotes=2))
+    decisions = asyncio.run(strategy.plan_entries(broker, 200.0))
+    assert [d.symbol for d in decisions] == ["AAA", "BBB", "DDD"]
+    assert broker.max_in_flight == 2
+
+
+def test_strategy_reused_across_event_loops_still_quotes():
+    broker = FakeBroker({"AAA": 10.0, "BBB": 20.0})
+    strategy = Strategy(make_settings(max_concurrent_quotes=1))
+    for _ in range(2):
+        decisions = asyncio.run(strategy.plan_entries(broker, 200.0))
+        assert [d.symbol for d in decisions] == ["AAA", "BBB"]
+
+
+def test_strategy_reused_across_event_loops_still_places_orders():
+    broker = FakeBroker({"AAA": 10.0, "BBB": 20.0})
+    strategy = Strategy(make_settings(max_order_concurrency=1))
+    for _ in range(2):
+        results = asyncio.run(strategy.execute(broker))
+        assert [r.symbol for r in results] == ["AAA", "BBB"]
+
+
+def test_execute_fetches_each_quote_once():
+    broker = FakeBroker({"AAA": 100.0, "BBB": 50.0}, [Position("AAA", 1, 100.0)])
+    results = asyncio.run(Strategy(make_settings()).execute(broker))
+    assert sorted(broker.quote_calls) == ["AAA", "BBB"]
+    assert [(r.symbol, r.side) for r in results] == [("AAA", "buy"), ("BBB", "buy")]
+
+
+def test_execute_does_not_refetch_a_failed_quote():
+    broker = FakeBroker({"AAA": 100.0}, [Position("BBB", 1, 100.0)])
+    results = asyncio.run(Strategy(make_settings()).execute(broker))
+    assert sorted(broker.quote_calls) == ["AAA", "BBB"]
+    assert [(r.symbol, r.side) for r in results] == [("AAA", "buy")]
+
+
+def test_concurrent_quote_requests_are_coalesced():
+    broker = FakeBroker({"AAA": 100.0})
+    strategy = Strategy(make_settings())
+    quotes = asyncio.run(strategy._fetch_quotes(broker, ["AAA", "AAA", "AAA"]))
+    assert [q.price for q in quotes] == [100.0, 100.0, 100.0]
+    assert broker.quote_calls == ["AAA"]
+
+
+class BatchBroker(FakeBroker):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batches: List[List[tuple]] = []
+        self.quote_batches: List[List[str]] = []
+
+    async def fetch_quotes(self, symbols):
+        self.quote_batches.append(list(symbols))
+        return {s: Quote(symbol=s, price=self.prices[s]) for s in symbols if s in self.prices}
+
+    async def place_orders(self, orders):
+        self.batches.append(list(orders))
+        return [
+            OrderResult(symbol=s, qty=q, side=side, price=self.prices[s]) for s, q, side in orders
+        ]
+
+
+class FailingBatchBroker(BatchBroker):
+    async def fetch_quotes(self, symbols):
+        self.quote_batches.append(list(symbols))
+        raise TimeoutError("market data timed out")
+
+
+def test_execute_uses_native_order_batch():
+    broker = BatchBroker({"AAA": 80.0, "BBB": 50.0}, [Position("AAA", 1, 100.0)])
+    results = asyncio.run(Strategy(make_settings()).execute(broker))
+    assert [[(s, side) for s, _, side in batch] for batch in broker.batches] == [
+        [("AAA", "sell")],
+        [("AAA", "buy"), ("BBB", "buy")],
+    ]
+    assert len(results) == 3
+
+
+class RejectingBatchBroker(BatchBroker):
+    async def place_orders(self, orders):
+        results = await super().place_orders(orders)
+        return [
+            ValueError("rejected") if s == "AAA" else r for (s, _, _), r in zip(orders, results)
+        ]
+
+
+def test_execute_keeps_batch_fills_when_one_order_fails():
+    broker = RejectingBatchBroker({"AAA": 100.0, "BBB": 50.0})
+    results = asyncio.run(Strategy(make_settings()).execute(broker))
+    assert [(r.symbol, r.side) for r in results] == [("BBB", "buy")]
+
+
+def test_plan_entries_skips_only_symbols_the_broker_does_not_know():
+    broker = FakeBroker({"AAA": 10.0, "NOTICK": 0.0})
+    strategy = Strategy(make_settings(universe=["AAA", "NOTICK", "MISSING"]))
+    asyncio.run(strategy.plan_entries(broker, 200.0))
+    asyncio.run(strategy.plan_entries(broker, 200.0))
+    assert sorted(broker.quote_calls) == ["AAA", "AAA", "MISSING", "NOTICK", "NOTICK"]
+
+
+def test_plan_entries_does_not_skip_symbols_after_a_failed_batch():
+    broker = FailingBatchBroker({"AAA": 10.0, "BBB": 20.0})
+    strategy = Strategy(make_settings())
+    assert asyncio.run(strategy.plan_entries(broker, 200.0)) == []
+    assert strategy._skip_symbols == {}
+    asyncio.run(strategy.plan_entries(broker, 200.0))
+    assert broker.quote_batches == [["AAA", "BBB"], ["AAA", "BBB"]]
+
+
+def test_plan_exits_tracks_highest_price():
+    broker = FakeBroker({"AAA": 105.0}, [Position("AAA", 1, 100.0)])
+    strategy = Strategy(make_settings())
+    asyncio.run(strategy.plan_exits(broker))
+    assert strategy.highest_prices == {"AAA": 105.0}
+    broker.prices["AAA"] = 103.0
+    asyncio.run(strategy.plan_exits(broker))
+    assert strategy.highest_prices == {"AAA": 105.0}
+    broker.prices["AAA"] = 120.0
+    asyncio.run(strategy.plan_exits(broker))
+    assert strategy.highest_prices == {}
+
+
+def test_direct_plan_exits_calls_fetch_fresh_quotes():
+    broker = FakeBroker({"AAA": 100.0}, [Position("AAA", 1, 100.0)])
+    strategy = Strategy(make_settings())
+    assert asyncio.run(strategy.plan_exits(broker)) == []
+    broker.prices["AAA"] = 50.0
+    assert [d.symbol for d in asyncio.run(strategy.plan_exits(broker))] == ["AAA"]
+    assert broker.quote_calls == ["AAA", "AAA"]
+
+
+def test_plan_entries_skips_quotes_when_allocation_below_minimum():
+    broker = FakeBroker({f"S{i}": 1.0 for i in range(10)})
+    strategy = Strategy(make_settings(universe=[f"S{i}" for i in range(10)]))
+    assert asyncio.run(strategy.plan_entries(broker, 60.0)) == []
+    assert broker.quote_calls == []
+
+
+def test_plan_entries_uses_native_quote_batch():
+    broker = BatchBroker({"AAA": 10.0, "BBB": 20.0})
+    strategy = Strategy(make_settings(universe=["AAA", "BBB", "MISSING"]))
+    decisions = asyncio.run(strategy.plan_entries(broker, 200.0))
+    assert broker.quote_batches == [["AAA", "BBB", "MISSING"]]
+    assert broker.quote_calls == []
+    assert [d.symbol for d in decisions] == ["AAA", "BBB"]
+
+
+def test_execute_sends_one_batch_when_the_batch_fails():
+    broker = FailingBatchBroker({"AAA": 100.0}, [Position("AAA", 1, 100.0)])
+    assert asyncio.run(Strategy(make_settings()).execute(broker)) == []
+    assert broker.quote_batches == [["AAA", "BBB"]]
+
+
+def test_execute_quotes_positions_and_universe_in_one_batch():
+    broker = BatchBroker({"AAA": 100.0, "BBB": 50.0, "CCC": 20.0}, [Position("CCC", 1, 20.0)])
+    asyncio.run(Strategy(make_settings()).execute(broker))
+    assert broker.quote_batches == [["CCC", "AAA", "BBB"]]